@@ -0,0 +1,42 @@
+"""
+One-shot migration: convert timestamps stored as ISO strings to native BSON dates.
+
+Older documents were written with `.isoformat()` strings; the API now stores and
+reads datetimes directly. Run once per database:
+
+    python migrate_timestamps.py
+"""
+
+import os
+from pathlib import Path
+from dotenv import load_dotenv
+from pymongo import MongoClient
+
+ROOT_DIR = Path(__file__).parent
+load_dotenv(ROOT_DIR / '.env')
+
+# collection -> datetime fields that may still hold ISO strings
+TIMESTAMP_FIELDS = {
+    "status_checks": ["timestamp"],
+    "hospitals": ["last_updated"],
+    "predictions": ["valid_from", "valid_until", "created_at"],
+}
+
+def migrate(db):
+    for collection, fields in TIMESTAMP_FIELDS.items():
+        for field in fields:
+            # Pipeline update converts in place, keeping the collection's indexes;
+            # unparseable strings are left as they are instead of aborting the batch
+            result = db[collection].update_many(
+                {field: {"$type": "string"}},
+                [{"$set": {field: {"$dateFromString": {"dateString": f"${field}", "onError": f"${field}"}}}}]
+            )
+            remaining = db[collection].count_documents({field: {"$type": "string"}})
+            print(f"{collection}.{field}: converted {result.modified_count} documents, {remaining} left as strings")
+
+if __name__ == "__main__":
+    client = MongoClient(os.environ['MONGO_URL'])
+    try:
+        migrate(client[os.environ['DB_NAME']])
+    finally:
+        client.close()
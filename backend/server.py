@@ -1,16 +1,23 @@
 from fastapi import FastAPI, APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
-from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import AsyncMongoClient
 import os
 import logging
 from pathlib import Path
 from pydantic import BaseModel, Field, ConfigDict
 from typing import List, Optional
 import uuid
+import random
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone, timedelta
-import httpx
+import orjson
 import asyncio
+import bisect
+import numpy as np
 from emergentintegrations.llm.chat import LlmChat, UserMessage
 
 ROOT_DIR = Path(__file__).parent
@@ -18,15 +25,43 @@ load_dotenv(ROOT_DIR / '.env')
 
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+client = AsyncMongoClient(mongo_url, maxPoolSize=50, tz_aware=True)
 db = client[os.environ['DB_NAME']]
 
 # API Keys
 EMERGENT_LLM_KEY = os.environ.get('EMERGENT_LLM_KEY', '')
 OPENWEATHERMAP_API_KEY = os.environ.get('OPENWEATHERMAP_API_KEY', 'demo')
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Prepare the database once before serving; close the MongoDB client on shutdown"""
+    if await db.hospitals.estimated_document_count() == 0:
+        await initialize_hospitals()
+    
+    await db.status_checks.create_index("id", unique=True)
+    await db.hospitals.create_index("id", unique=True)
+    await db.hospitals.create_index("region")
+    # Backfill GeoJSON points for hospitals stored before the location field existed;
+    # out-of-range coordinates would make the 2dsphere index build fail, so they are skipped
+    await db.hospitals.update_many(
+        {
+            "location": {"$exists": False},
+            "latitude": {"$gte": -90, "$lte": 90},
+            "longitude": {"$gte": -180, "$lte": 180}
+        },
+        [{"$set": {"location": {"type": "Point", "coordinates": ["$longitude", "$latitude"]}}}]
+    )
+    await db.hospitals.create_index([("location", "2dsphere")])
+    # /predictions/history: filtered by type or not, always newest first
+    await db.predictions.create_index([("disaster_type", 1), ("created_at", -1)])
+    await db.predictions.create_index([("created_at", -1)])
+    
+    yield
+    
+    await client.close()
+
 # Create the main app
-app = FastAPI(title="DisasterWatch Italy API")
+app = FastAPI(title="DisasterWatch Italy API", lifespan=lifespan, default_response_class=ORJSONResponse)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
@@ -42,7 +77,7 @@ logger = logging.getLogger(__name__)
 
 class StatusCheck(BaseModel):
     model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     client_name: str
     timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
@@ -51,7 +86,7 @@ class StatusCheckCreate(BaseModel):
 
 class SeismicEvent(BaseModel):
     model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     magnitude: float
     depth: float
     latitude: float
@@ -63,7 +98,7 @@ class SeismicEvent(BaseModel):
 
 class FloodAlert(BaseModel):
     model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     region: str
     risk_level: str  # low, moderate, high, critical
     river_name: Optional[str] = None
@@ -77,7 +112,7 @@ class FloodAlert(BaseModel):
 
 class HeatWaveAlert(BaseModel):
     model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     region: str
     temperature: float
     feels_like: float
@@ -91,7 +126,7 @@ class HeatWaveAlert(BaseModel):
 
 class Hospital(BaseModel):
     model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     name: str
     address: str
     city: str
@@ -112,8 +147,8 @@ class HospitalCreate(BaseModel):
     address: str
     city: str
     region: str
-    latitude: float
-    longitude: float
+    latitude: float = Field(ge=-90, le=90)
+    longitude: float = Field(ge=-180, le=180)
     total_beds: int
     available_beds: int
     icu_beds: int
@@ -130,7 +165,7 @@ class HospitalUpdate(BaseModel):
 
 class Prediction(BaseModel):
     model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     disaster_type: str  # seismic, flood, heatwave
     region: str
     prediction_text: str
@@ -143,7 +178,7 @@ class Prediction(BaseModel):
 
 class SafeZone(BaseModel):
     model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     name: str
     zone_type: str  # earthquake_shelter, flood_high_ground, cooling_center
     latitude: float
@@ -155,24 +190,63 @@ class SafeZone(BaseModel):
 
 # ==================== HELPER FUNCTIONS ====================
 
+# Risk ladders: values at or above each threshold move up one level
+RISK_LEVELS = ("low", "moderate", "high", "critical")
+SEISMIC_MAGNITUDE_THRESHOLDS = (4.0, 5.0, 6.0)
+HEAT_INDEX_THRESHOLDS = (35, 45, 55)
+
 def calculate_seismic_risk(magnitude: float, depth: float) -> str:
-    if magnitude >= 6.0:
-        return "critical"
-    elif magnitude >= 5.0:
-        return "high"
-    elif magnitude >= 4.0:
-        return "moderate"
-    return "low"
+    return RISK_LEVELS[bisect.bisect_right(SEISMIC_MAGNITUDE_THRESHOLDS, magnitude)]
 
 def calculate_heat_risk(temperature: float, humidity: float) -> str:
     heat_index = temperature + (0.5 * humidity)
-    if heat_index >= 55:
-        return "critical"
-    elif heat_index >= 45:
-        return "high"
-    elif heat_index >= 35:
-        return "moderate"
-    return "low"
+    return RISK_LEVELS[bisect.bisect_right(HEAT_INDEX_THRESHOLDS, heat_index)]
+
+EARTH_RADIUS_KM = 6371.0
+
+def haversine_rad(lat1: float, lon1: float, lat2: np.ndarray, lon2: np.ndarray, cos_lat2: np.ndarray) -> np.ndarray:
+    """Great-circle distance in km from one point to each point of the arrays (all in radians, cos(lat2) precomputed)"""
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * cos_lat2 * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+def _as_hospital(doc: dict) -> Hospital:
+    """Wrap a stored hospital document without re-validating it (input models stay validated)"""
+    return Hospital.model_construct(**doc)
+
+def geo_point(latitude: float, longitude: float) -> dict:
+    """GeoJSON point for 2dsphere-indexed fields (MongoDB expects [lon, lat])"""
+    return {"type": "Point", "coordinates": [longitude, latitude]}
+
+def ttl_get(store: dict, key, ttl: float):
+    """Value cached under `key` if younger than `ttl` seconds, else None"""
+    entry = store.get(key)
+    if entry is not None and time.monotonic() - entry[0] < ttl:
+        return entry[1]
+    return None
+
+def ttl_put(store: dict, key, value, ttl: float):
+    """Cache `value` under `key`, evicting entries older than `ttl` seconds"""
+    now = time.monotonic()
+    for stale in [k for k, (ts, _) in store.items() if now - ts >= ttl]:
+        del store[stale]
+    store[key] = (now, value)
+
+# Shared generator for vectorized noise in the simulated data
+rng = np.random.default_rng()
+
+# Simulated feeds are regenerated at most once per TTL instead of on every request
+SAMPLE_TTL_SECONDS = 120
+_sample_snapshots: dict = {}  # name -> (monotonic timestamp, list of models)
+
+def sample_snapshot(name: str, build):
+    """Return the cached output of `build()` for `name`, rebuilding once it is stale"""
+    built_at, items = _sample_snapshots.get(name, (0.0, []))
+    now = time.monotonic()
+    if built_at and now - built_at < SAMPLE_TTL_SECONDS:
+        return items
+    items = build()
+    _sample_snapshots[name] = (now, items)
+    return items
 
 # ==================== ITALY REGIONS DATA ====================
 
@@ -282,6 +356,56 @@ EXTENDED_HEAT_CITIES = [
     {"city": "Perugia", "region": "Umbria", "lat": 43.1107, "lon": 12.3908, "base_temp": 36},
 ]
 
+SAFE_ZONE_FACILITIES = ("Water", "First Aid", "Shelter", "Communications")
+
+# Safe zones are static, so their serialized payloads are built once (ids stay stable across requests);
+# the values come from the constant table above and need no validation
+ALL_SAFE_ZONES = [
+    SafeZone.model_construct(
+        name=z["name"],
+        zone_type=z["type"],
+        latitude=z["lat"],
+        longitude=z["lon"],
+        capacity=z["capacity"],
+        address=f"Emergency Assembly Point, {z['region']}",
+        region=z["region"],
+        facilities=list(SAFE_ZONE_FACILITIES)
+    ).model_dump()
+    for z in SAFE_ZONES
+]
+
+# Safe zone payload lookups by region / zone type
+SAFE_ZONES_BY_REGION = defaultdict(list)
+SAFE_ZONES_BY_TYPE = defaultdict(list)
+for _zone in ALL_SAFE_ZONES:
+    SAFE_ZONES_BY_REGION[_zone["region"]].append(_zone)
+    SAFE_ZONES_BY_TYPE[_zone["zone_type"]].append(_zone)
+
+def build_zone_coords(zones: List[dict]) -> tuple:
+    """Structure-of-arrays view of `zones`: (lat rad, lon rad, cos lat, zone payloads) for haversine sweeps"""
+    lats = np.radians(np.array([z["latitude"] for z in zones], dtype=np.float64))
+    lons = np.radians(np.array([z["longitude"] for z in zones], dtype=np.float64))
+    return lats, lons, np.cos(lats), zones
+
+# Contiguous coordinate blocks per zone type (key None covers every zone), so lookups need no gather
+SAFE_ZONE_COORDS = {None: build_zone_coords(ALL_SAFE_ZONES)}
+SAFE_ZONE_COORDS.update({t: build_zone_coords(zones) for t, zones in SAFE_ZONES_BY_TYPE.items()})
+
+# Search radius for /hospitals/nearby, in meters
+NEARBY_MAX_DISTANCE_M = 100000
+
+# Fields returned by /hospitals/nearby - equipment, address, phone etc. stay server-side
+NEARBY_HOSPITAL_FIELDS = {
+    "_id": 0, "id": 1, "name": 1, "city": 1, "region": 1, "latitude": 1, "longitude": 1,
+    "total_beds": 1, "available_beds": 1, "icu_beds": 1, "icu_available": 1
+}
+
+# Fields serialized by /predictions/history
+PREDICTION_HISTORY_FIELDS = {
+    "_id": 0, "id": 1, "disaster_type": 1, "region": 1, "prediction_text": 1, "risk_level": 1,
+    "confidence": 1, "valid_from": 1, "valid_until": 1, "recommendations": 1, "created_at": 1
+}
+
 # ==================== API ROUTES ====================
 
 @api_router.get("/")
@@ -292,18 +416,13 @@ async def root():
 async def create_status_check(input: StatusCheckCreate):
     status_dict = input.model_dump()
     status_obj = StatusCheck(**status_dict)
-    doc = status_obj.model_dump()
-    doc['timestamp'] = doc['timestamp'].isoformat()
-    await db.status_checks.insert_one(doc)
+    await db.status_checks.insert_one(status_obj.model_dump())
     return status_obj
 
 @api_router.get("/status", response_model=List[StatusCheck])
 async def get_status_checks():
-    status_checks = await db.status_checks.find({}, {"_id": 0}).to_list(1000)
-    for check in status_checks:
-        if isinstance(check['timestamp'], str):
-            check['timestamp'] = datetime.fromisoformat(check['timestamp'])
-    return status_checks
+    cursor = db.status_checks.find({}, {"_id": 0}).limit(1000).batch_size(100)
+    return [check async for check in cursor]
 
 # ==================== SEISMIC ENDPOINTS ====================
 
@@ -324,23 +443,33 @@ async def get_seismic_events(
 
 def get_sample_seismic_events() -> List[SeismicEvent]:
     """Return comprehensive seismic data for Italy"""
-    import random
+    return sample_snapshot("seismic", build_sample_seismic_events)
+
+def build_sample_seismic_events() -> List[SeismicEvent]:
+    """Randomize EXTENDED_SEISMIC_DATA into a fresh set of events, newest first"""
     events = []
     
+    # Add some randomness to make data dynamic - one batch draw per field
+    n = len(EXTENDED_SEISMIC_DATA)
+    mag_noise = rng.uniform(-0.3, 0.3, n).tolist()
+    depth_noise = rng.uniform(-2, 2, n).tolist()
+    lat_noise = rng.uniform(-0.1, 0.1, n).tolist()
+    lon_noise = rng.uniform(-0.1, 0.1, n).tolist()
+    hours_ago = rng.integers(1, 169, n).tolist()
+    now = datetime.now(timezone.utc)
+    
     for i, data in enumerate(EXTENDED_SEISMIC_DATA):
-        # Add some randomness to make data dynamic
-        mag = data["mag"] + random.uniform(-0.3, 0.3)
-        depth = data["depth"] + random.uniform(-2, 2)
-        hours_ago = random.randint(1, 168)
+        mag = data["mag"] + mag_noise[i]
+        depth = data["depth"] + depth_noise[i]
         
         events.append(SeismicEvent(
             id=f"it-seismic-{i+1}",
             magnitude=round(mag, 1),
             depth=round(max(1, depth), 1),
-            latitude=data["lat"] + random.uniform(-0.1, 0.1),
-            longitude=data["lon"] + random.uniform(-0.1, 0.1),
+            latitude=data["lat"] + lat_noise[i],
+            longitude=data["lon"] + lon_noise[i],
             location=data["location"],
-            timestamp=datetime.now(timezone.utc) - timedelta(hours=hours_ago),
+            timestamp=now - timedelta(hours=hours_ago[i]),
             risk_level=calculate_seismic_risk(mag, depth)
         ))
     
@@ -351,19 +480,24 @@ async def get_seismic_stats():
     """Get seismic statistics for Italy"""
     events = await get_seismic_events(min_magnitude=2.0, days=30)
     
-    total = len(events)
-    critical = len([e for e in events if e.risk_level == "critical"])
-    high = len([e for e in events if e.risk_level == "high"])
-    moderate = len([e for e in events if e.risk_level == "moderate"])
+    # Single pass over the events for all counters
+    counts = {"critical": 0, "high": 0, "moderate": 0}
+    mag_sum = 0.0
+    max_mag = 0.0
+    for e in events:
+        counts[e.risk_level] = counts.get(e.risk_level, 0) + 1
+        mag_sum += e.magnitude
+        if e.magnitude > max_mag:
+            max_mag = e.magnitude
     
-    max_mag = max([e.magnitude for e in events]) if events else 0
-    avg_mag = sum([e.magnitude for e in events]) / total if total > 0 else 0
+    total = len(events)
+    avg_mag = mag_sum / total if total > 0 else 0
     
     return {
         "total_events": total,
-        "critical_events": critical,
-        "high_risk_events": high,
-        "moderate_events": moderate,
+        "critical_events": counts["critical"],
+        "high_risk_events": counts["high"],
+        "moderate_events": counts["moderate"],
         "max_magnitude": round(max_mag, 1),
         "avg_magnitude": round(avg_mag, 2),
         "period_days": 30,
@@ -375,7 +509,10 @@ async def get_seismic_stats():
 @api_router.get("/flood/alerts", response_model=List[FloodAlert])
 async def get_flood_alerts():
     """Get current flood alerts for Italy"""
-    import random
+    return sample_snapshot("flood", build_sample_flood_alerts)
+
+def build_sample_flood_alerts() -> List[FloodAlert]:
+    """Randomize water levels and risk for every EXTENDED_FLOOD_DATA zone"""
     alerts = []
     
     for data in EXTENDED_FLOOD_DATA:
@@ -409,70 +546,90 @@ async def get_flood_alerts():
 async def get_flood_stats():
     """Get flood statistics"""
     alerts = await get_flood_alerts()
+    
+    counts = {"critical": 0, "high": 0}
+    evacuations = 0
+    for a in alerts:
+        counts[a.risk_level] = counts.get(a.risk_level, 0) + 1
+        if a.evacuation_advised:
+            evacuations += 1
+    
     return {
         "active_alerts": len(alerts),
-        "critical_zones": len([a for a in alerts if a.risk_level == "critical"]),
-        "high_risk_zones": len([a for a in alerts if a.risk_level == "high"]),
-        "evacuations_advised": len([a for a in alerts if a.evacuation_advised]),
-        "affected_regions": list(set([a.region.split(" - ")[-1] if " - " in a.region else a.region for a in alerts]))
+        "critical_zones": counts["critical"],
+        "high_risk_zones": counts["high"],
+        "evacuations_advised": evacuations,
+        "affected_regions": list({a.region.split(" - ")[-1] for a in alerts})
     }
 
 # ==================== HEAT WAVE ENDPOINTS ====================
 
+def get_sample_heatwave_alert(city_data: dict) -> HeatWaveAlert:
+    """Simulated reading around the city's seasonal base temperature"""
+    temp = city_data["base_temp"] + random.uniform(-3, 5)
+    humidity = random.uniform(35, 75)
+    feels_like = temp + (humidity / 15)  # Heat index approximation
+    
+    risk_level = calculate_heat_risk(temp, humidity)
+    
+    # Generate appropriate advisory based on risk
+    if risk_level == "critical":
+        advisory = "EXTREME HEAT EMERGENCY - Seek air conditioning immediately. Check on elderly and vulnerable."
+        duration = random.randint(48, 96)
+    elif risk_level == "high":
+        advisory = "HIGH HEAT WARNING - Limit outdoor activities. Stay hydrated. Avoid peak sun hours."
+        duration = random.randint(24, 72)
+    elif risk_level == "moderate":
+        advisory = "HEAT ADVISORY - Stay hydrated and take regular breaks from heat exposure."
+        duration = random.randint(12, 48)
+    else:
+        advisory = "Normal summer conditions. Standard heat precautions recommended."
+        duration = random.randint(6, 24)
+    
+    return HeatWaveAlert(
+        region=f"{city_data['city']}, {city_data['region']}",
+        temperature=round(temp, 1),
+        feels_like=round(feels_like, 1),
+        humidity=round(humidity, 1),
+        risk_level=risk_level,
+        duration_hours=duration,
+        latitude=city_data["lat"],
+        longitude=city_data["lon"],
+        advisory=advisory
+    )
+
+def build_sample_heatwave_alerts() -> List[HeatWaveAlert]:
+    """Simulated alerts for every EXTENDED_HEAT_CITIES entry, hottest first"""
+    alerts = [get_sample_heatwave_alert(c) for c in EXTENDED_HEAT_CITIES]
+    # Sort by temperature (hottest first)
+    return sorted(alerts, key=lambda x: x.temperature, reverse=True)
+
 @api_router.get("/heatwave/alerts", response_model=List[HeatWaveAlert])
 async def get_heatwave_alerts():
     """Get heat wave alerts for major Italian cities"""
-    import random
-    alerts = []
-    
-    for city_data in EXTENDED_HEAT_CITIES:
-        # Generate temperature based on base temp with variation
-        temp = city_data["base_temp"] + random.uniform(-3, 5)
-        humidity = random.uniform(35, 75)
-        feels_like = temp + (humidity / 15)  # Heat index approximation
-        
-        risk_level = calculate_heat_risk(temp, humidity)
-        
-        # Generate appropriate advisory based on risk
-        if risk_level == "critical":
-            advisory = "EXTREME HEAT EMERGENCY - Seek air conditioning immediately. Check on elderly and vulnerable."
-            duration = random.randint(48, 96)
-        elif risk_level == "high":
-            advisory = "HIGH HEAT WARNING - Limit outdoor activities. Stay hydrated. Avoid peak sun hours."
-            duration = random.randint(24, 72)
-        elif risk_level == "moderate":
-            advisory = "HEAT ADVISORY - Stay hydrated and take regular breaks from heat exposure."
-            duration = random.randint(12, 48)
-        else:
-            advisory = "Normal summer conditions. Standard heat precautions recommended."
-            duration = random.randint(6, 24)
-        
-        alerts.append(HeatWaveAlert(
-            region=f"{city_data['city']}, {city_data['region']}",
-            temperature=round(temp, 1),
-            feels_like=round(feels_like, 1),
-            humidity=round(humidity, 1),
-            risk_level=risk_level,
-            duration_hours=duration,
-            latitude=city_data["lat"],
-            longitude=city_data["lon"],
-            advisory=advisory
-        ))
-    
-    # Sort by temperature (hottest first)
-    return sorted(alerts, key=lambda x: x.temperature, reverse=True)
+    return sample_snapshot("heatwave", build_sample_heatwave_alerts)
 
 @api_router.get("/heatwave/stats")
 async def get_heatwave_stats():
     """Get heat wave statistics"""
     alerts = await get_heatwave_alerts()
+    
+    counts = {"critical": 0, "high": 0}
+    temp_sum = 0.0
+    max_temp = float("-inf")
+    for a in alerts:
+        counts[a.risk_level] = counts.get(a.risk_level, 0) + 1
+        temp_sum += a.temperature
+        if a.temperature > max_temp:
+            max_temp = a.temperature
+    
     return {
         "active_alerts": len(alerts),
-        "critical_areas": len([a for a in alerts if a.risk_level == "critical"]),
-        "high_risk_areas": len([a for a in alerts if a.risk_level == "high"]),
-        "max_temperature": max([a.temperature for a in alerts]) if alerts else 0,
-        "avg_temperature": round(sum([a.temperature for a in alerts]) / len(alerts), 1) if alerts else 0,
-        "affected_regions": list(set([a.region.split(", ")[-1] for a in alerts]))
+        "critical_areas": counts["critical"],
+        "high_risk_areas": counts["high"],
+        "max_temperature": max_temp if alerts else 0,
+        "avg_temperature": round(temp_sum / len(alerts), 1) if alerts else 0,
+        "affected_regions": list({a.region.split(", ")[-1] for a in alerts})
     }
 
 # ==================== HOSPITAL ENDPOINTS ====================
@@ -480,28 +637,22 @@ async def get_heatwave_stats():
 @api_router.get("/hospitals", response_model=List[Hospital])
 async def get_hospitals(region: Optional[str] = None):
     """Get hospitals with bed availability"""
-    # Check if we have hospitals in DB
     query = {} if not region else {"region": region}
-    hospitals = await db.hospitals.find(query, {"_id": 0}).to_list(100)
-    
-    if not hospitals:
-        # Initialize with sample data
-        await initialize_hospitals()
-        hospitals = await db.hospitals.find(query, {"_id": 0}).to_list(100)
-    
-    # Convert timestamps
-    for h in hospitals:
-        if isinstance(h.get('last_updated'), str):
-            h['last_updated'] = datetime.fromisoformat(h['last_updated'])
-    
-    return hospitals
+    # Wrap documents as batches arrive instead of materializing the whole cursor first
+    cursor = db.hospitals.find(query, {"_id": 0, "location": 0}).limit(100).batch_size(32)
+    return [_as_hospital(h) async for h in cursor]
 
 async def initialize_hospitals():
-    """Initialize hospital data"""
-    import random
-    for h in SAMPLE_HOSPITALS:
-        available = int(h["total_beds"] * random.uniform(0.3, 0.7))
-        icu_available = int(h["icu_beds"] * random.uniform(0.2, 0.6))
+    """Seed the hospitals collection with sample data (run once at startup)"""
+    n = len(SAMPLE_HOSPITALS)
+    bed_ratios = rng.uniform(0.3, 0.7, n).tolist()
+    icu_ratios = rng.uniform(0.2, 0.6, n).tolist()
+    phone_numbers = rng.integers(1000000, 10000000, n).tolist()
+    
+    docs = []
+    for i, h in enumerate(SAMPLE_HOSPITALS):
+        available = int(h["total_beds"] * bed_ratios[i])
+        icu_available = int(h["icu_beds"] * icu_ratios[i])
         
         hospital = Hospital(
             name=h["name"],
@@ -515,173 +666,194 @@ async def initialize_hospitals():
             icu_beds=h["icu_beds"],
             icu_available=icu_available,
             equipment=["Ventilators", "CT Scanner", "MRI", "X-Ray", "ECG", "Defibrillators"],
-            contact_phone=f"+39 02 {random.randint(1000000, 9999999)}"
+            contact_phone=f"+39 02 {phone_numbers[i]}"
         )
         
         doc = hospital.model_dump()
-        doc['last_updated'] = doc['last_updated'].isoformat()
-        await db.hospitals.update_one(
-            {"id": doc["id"]},
-            {"$set": doc},
-            upsert=True
-        )
+        doc['location'] = geo_point(doc['latitude'], doc['longitude'])
+        docs.append(doc)
+    
+    # Single round trip for the whole sample set
+    await db.hospitals.insert_many(docs, ordered=False)
 
 @api_router.post("/hospitals", response_model=Hospital)
 async def create_hospital(hospital_data: HospitalCreate):
     """Create a new hospital (Admin)"""
     hospital = Hospital(**hospital_data.model_dump())
     doc = hospital.model_dump()
-    doc['last_updated'] = doc['last_updated'].isoformat()
+    doc['location'] = geo_point(doc['latitude'], doc['longitude'])
     await db.hospitals.insert_one(doc)
     return hospital
 
 @api_router.put("/hospitals/{hospital_id}", response_model=Hospital)
 async def update_hospital(hospital_id: str, update_data: HospitalUpdate):
     """Update hospital bed availability (Admin)"""
-    update_dict = {k: v for k, v in update_data.model_dump().items() if v is not None}
-    update_dict['last_updated'] = datetime.now(timezone.utc).isoformat()
+    # Only fields the client sent; an explicit null is skipped because stored hospitals require values
+    update_dict = update_data.model_dump(exclude_unset=True, exclude_none=True)
+    update_dict['last_updated'] = datetime.now(timezone.utc)
     
     result = await db.hospitals.find_one_and_update(
         {"id": hospital_id},
         {"$set": update_dict},
         return_document=True,
-        projection={"_id": 0}
+        projection={"_id": 0, "location": 0}
     )
     
     if not result:
         raise HTTPException(status_code=404, detail="Hospital not found")
     
-    if isinstance(result.get('last_updated'), str):
-        result['last_updated'] = datetime.fromisoformat(result['last_updated'])
-    
-    return Hospital(**result)
+    return _as_hospital(result)
 
 @api_router.get("/hospitals/stats")
 async def get_hospital_stats():
     """Get aggregate hospital statistics"""
-    # Get raw hospital data from DB
-    query = {}
-    hospitals = await db.hospitals.find(query, {"_id": 0}).to_list(100)
-    
-    if not hospitals:
-        await initialize_hospitals()
-        hospitals = await db.hospitals.find(query, {"_id": 0}).to_list(100)
-    
-    total_beds = sum([h.get('total_beds', 0) for h in hospitals])
-    available_beds = sum([h.get('available_beds', 0) for h in hospitals])
-    total_icu = sum([h.get('icu_beds', 0) for h in hospitals])
-    available_icu = sum([h.get('icu_available', 0) for h in hospitals])
+    # Totals are computed server-side so only one summary document crosses the wire
+    cursor = await db.hospitals.aggregate([
+        {"$group": {
+            "_id": None,
+            "count": {"$sum": 1},
+            "total_beds": {"$sum": "$total_beds"},
+            "available_beds": {"$sum": "$available_beds"},
+            "total_icu": {"$sum": "$icu_beds"},
+            "available_icu": {"$sum": "$icu_available"},
+            "emergency_ready": {"$sum": {"$cond": ["$emergency_capacity", 1, 0]}}
+        }}
+    ])
+    totals = await cursor.to_list(1)
+    stats = totals[0] if totals else {}
+    
+    total_beds = stats.get('total_beds', 0)
+    available_beds = stats.get('available_beds', 0)
+    total_icu = stats.get('total_icu', 0)
+    available_icu = stats.get('available_icu', 0)
     
     return {
-        "total_hospitals": len(hospitals),
+        "total_hospitals": stats.get('count', 0),
         "total_beds": total_beds,
         "available_beds": available_beds,
         "occupancy_rate": round((total_beds - available_beds) / total_beds * 100, 1) if total_beds > 0 else 0,
         "total_icu": total_icu,
         "available_icu": available_icu,
         "icu_occupancy_rate": round((total_icu - available_icu) / total_icu * 100, 1) if total_icu > 0 else 0,
-        "emergency_ready": len([h for h in hospitals if h.get('emergency_capacity', False)])
+        "emergency_ready": stats.get('emergency_ready', 0)
     }
 
 @api_router.get("/hospitals/nearby")
-async def get_nearby_hospitals(lat: float, lon: float, limit: int = 5):
+async def get_nearby_hospitals(
+    lat: float = Query(..., ge=-90, le=90),
+    lon: float = Query(..., ge=-180, le=180),
+    limit: int = Query(5, ge=1)
+):
     """Get nearest hospitals to a location"""
-    # Get raw hospital data from DB
-    hospitals = await db.hospitals.find({}, {"_id": 0}).to_list(100)
-    
-    if not hospitals:
-        await initialize_hospitals()
-        hospitals = await db.hospitals.find({}, {"_id": 0}).to_list(100)
-    
-    def distance(h):
-        return ((h.get('latitude', 0) - lat) ** 2 + (h.get('longitude', 0) - lon) ** 2) ** 0.5
-    
-    sorted_hospitals = sorted(hospitals, key=distance)
-    
-    # Convert timestamps for response
-    for h in sorted_hospitals[:limit]:
-        if isinstance(h.get('last_updated'), str):
-            h['last_updated'] = datetime.fromisoformat(h['last_updated'])
-    
-    return sorted_hospitals[:limit]
+    # $geoNear walks the 2dsphere index nearest-first and annotates each hit with its distance
+    cursor = await db.hospitals.aggregate([
+        {"$geoNear": {
+            "near": geo_point(lat, lon),
+            "distanceField": "distance_m",
+            "maxDistance": NEARBY_MAX_DISTANCE_M,
+            "spherical": True
+        }},
+        {"$limit": limit},
+        {"$project": {**NEARBY_HOSPITAL_FIELDS, "distance_m": 1}}
+    ])
+    return await cursor.to_list(limit)
 
 # ==================== SAFE ZONES ENDPOINTS ====================
 
 @api_router.get("/safezones", response_model=List[SafeZone])
 async def get_safe_zones(zone_type: Optional[str] = None, region: Optional[str] = None):
     """Get safe zones/evacuation points"""
-    zones = []
-    for z in SAFE_ZONES:
-        if zone_type and z["type"] != zone_type:
-            continue
-        if region and z["region"] != region:
-            continue
-        
-        zones.append(SafeZone(
-            name=z["name"],
-            zone_type=z["type"],
-            latitude=z["lat"],
-            longitude=z["lon"],
-            capacity=z["capacity"],
-            address=f"Emergency Assembly Point, {z['region']}",
-            region=z["region"],
-            facilities=["Water", "First Aid", "Shelter", "Communications"]
-        ))
+    # Serve straight from the prebuilt buckets; only region + zone_type needs a filter pass
+    if region:
+        zones = SAFE_ZONES_BY_REGION.get(region, [])
+        if zone_type:
+            zones = [z for z in zones if z["zone_type"] == zone_type]
+    elif zone_type:
+        zones = SAFE_ZONES_BY_TYPE.get(zone_type, [])
+    else:
+        zones = ALL_SAFE_ZONES
     
-    return zones
+    # Trusted static data - hand orjson the payloads directly (response_model stays for the schema)
+    return ORJSONResponse(zones)
 
 @api_router.get("/safezones/nearest")
 async def get_nearest_safe_zone(lat: float, lon: float, zone_type: Optional[str] = None):
     """Find nearest safe zone"""
-    zones = await get_safe_zones(zone_type=zone_type)
+    entry = SAFE_ZONE_COORDS.get(zone_type or None)
     
-    if not zones:
+    if entry is None:
         raise HTTPException(status_code=404, detail="No safe zones found")
     
-    def distance(z):
-        return ((z.latitude - lat) ** 2 + (z.longitude - lon) ** 2) ** 0.5
-    
-    nearest = min(zones, key=distance)
-    dist_km = distance(nearest) * 111  # Rough conversion to km
+    lats, lons, cos_lats, zones = entry
+    distances = haversine_rad(np.radians(lat), np.radians(lon), lats, lons, cos_lats)
+    best = int(np.argmin(distances))
     
     return {
-        "zone": nearest,
-        "distance_km": round(dist_km, 2)
+        "zone": zones[best],
+        "distance_km": round(float(distances[best]), 2)
     }
 
 # ==================== AI PREDICTIONS ENDPOINT ====================
 
+PREDICTION_MODEL = ("openai", "gpt-5.2")
+PREDICTION_SYSTEM_PROMPT = """You are an expert disaster prediction analyst for Italy. 
+Provide concise, actionable predictions based on the data provided.
+Include: risk assessment (low/moderate/high/critical), confidence level (0-100%), 
+24-48 hour forecast, and 3 specific recommendations.
+Be direct and professional. Format response as JSON with keys: 
+risk_level, confidence, forecast, recommendations (array)"""
+
+# Context inputs change on a scale of minutes; identical prompts reuse the stored prediction
+CONTEXT_TTL_SECONDS = 60
+PREDICTION_TTL_SECONDS = 300
+_context_cache: dict = {}  # disaster_type -> (monotonic timestamp, context text)
+_prediction_cache: dict = {}  # (disaster_type, region, context) -> (monotonic timestamp, Prediction)
+
+async def get_prediction_context(disaster_type: str) -> str:
+    """Summary of current activity for the LLM prompt"""
+    context = ttl_get(_context_cache, disaster_type, CONTEXT_TTL_SECONDS)
+    if context is not None:
+        return context
+    
+    context = ""
+    # The stats endpoints already reduce each feed to counts and maxima in one pass
+    if disaster_type == "seismic":
+        stats = await get_seismic_stats()
+        context += f"Recent seismic activity: {stats['total_events']} events in last 30 days\n"
+        if stats["total_events"]:
+            context += f"Max magnitude: {stats['max_magnitude']}\n"
+    elif disaster_type == "flood":
+        alerts = await get_flood_alerts()
+        context += f"Current flood alerts: {len(alerts)}\n"
+    elif disaster_type == "heatwave":
+        stats = await get_heatwave_stats()
+        context += f"Current heat alerts: {stats['active_alerts']}\n"
+        if stats["active_alerts"]:
+            context += f"Max temperature: {stats['max_temperature']}°C\n"
+    
+    ttl_put(_context_cache, disaster_type, context, CONTEXT_TTL_SECONDS)
+    return context
+
 @api_router.post("/predictions/generate")
 async def generate_prediction(disaster_type: str, region: str):
     """Generate AI-powered disaster prediction"""
     try:
         # Gather context data
         context = f"Region: {region}, Italy\nDisaster Type: {disaster_type}\n"
+        context += await get_prediction_context(disaster_type)
         
-        if disaster_type == "seismic":
-            events = await get_seismic_events(min_magnitude=2.0, days=30)
-            context += f"Recent seismic activity: {len(events)} events in last 30 days\n"
-            if events:
-                context += f"Max magnitude: {max([e.magnitude for e in events])}\n"
-        elif disaster_type == "flood":
-            alerts = await get_flood_alerts()
-            context += f"Current flood alerts: {len(alerts)}\n"
-        elif disaster_type == "heatwave":
-            alerts = await get_heatwave_alerts()
-            context += f"Current heat alerts: {len(alerts)}\n"
-            if alerts:
-                context += f"Max temperature: {max([a.temperature for a in alerts])}°C\n"
+        # Same prompt within the TTL - return the prediction already generated for it
+        cache_key = (disaster_type, region, context)
+        cached = ttl_get(_prediction_cache, cache_key, PREDICTION_TTL_SECONDS)
+        if cached is not None:
+            return cached
         
+        # LlmChat carries per-session history, so each prediction gets its own session
         chat = LlmChat(
             api_key=EMERGENT_LLM_KEY,
-            session_id=f"prediction-{uuid.uuid4()}",
-            system_message="""You are an expert disaster prediction analyst for Italy. 
-Provide concise, actionable predictions based on the data provided.
-Include: risk assessment (low/moderate/high/critical), confidence level (0-100%), 
-24-48 hour forecast, and 3 specific recommendations.
-Be direct and professional. Format response as JSON with keys: 
-risk_level, confidence, forecast, recommendations (array)"""
-        ).with_model("openai", "gpt-5.2")
+            session_id=f"prediction-{os.urandom(8).hex()}",
+            system_message=PREDICTION_SYSTEM_PROMPT
+        ).with_model(*PREDICTION_MODEL)
         
         user_message = UserMessage(
             text=f"Analyze this disaster data and provide a 24-48 hour prediction:\n{context}"
@@ -690,13 +862,12 @@ risk_level, confidence, forecast, recommendations (array)"""
         response = await chat.send_message(user_message)
         
         # Parse response
-        import json
         try:
             # Try to extract JSON from response
             json_start = response.find('{')
             json_end = response.rfind('}') + 1
             if json_start >= 0 and json_end > json_start:
-                prediction_data = json.loads(response[json_start:json_end])
+                prediction_data = orjson.loads(response[json_start:json_end])
             else:
                 prediction_data = {
                     "risk_level": "moderate",
@@ -704,7 +875,7 @@ risk_level, confidence, forecast, recommendations (array)"""
                     "forecast": response,
                     "recommendations": ["Monitor official alerts", "Prepare emergency kit", "Know evacuation routes"]
                 }
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             prediction_data = {
                 "risk_level": "moderate",
                 "confidence": 70,
@@ -712,79 +883,92 @@ risk_level, confidence, forecast, recommendations (array)"""
                 "recommendations": ["Monitor official alerts", "Prepare emergency kit", "Know evacuation routes"]
             }
         
-        prediction = Prediction(
+        # Shape the parsed values ourselves so the model can be built without re-validation;
+        # anything missing, null or mistyped falls back to a safe default
+        forecast = prediction_data.get("forecast")
+        if not isinstance(forecast, str) or not forecast:
+            forecast = response
+        risk_level = str(prediction_data.get("risk_level") or "").strip().lower()
+        if risk_level not in RISK_LEVELS:
+            logger.warning(f"Unrecognized AI risk level {prediction_data.get('risk_level')!r}, using 'moderate'")
+            risk_level = "moderate"
+        confidence = prediction_data.get("confidence", 70)
+        if not isinstance(confidence, (int, float)) or isinstance(confidence, bool):
+            confidence = 70
+        recommendations = prediction_data.get("recommendations", [])
+        if not isinstance(recommendations, list):
+            recommendations = []
+        
+        now = datetime.now(timezone.utc)
+        prediction = Prediction.model_construct(
+            id=uuid.uuid4().hex,
             disaster_type=disaster_type,
             region=region,
-            prediction_text=prediction_data.get("forecast", response),
-            risk_level=prediction_data.get("risk_level", "moderate"),
-            confidence=prediction_data.get("confidence", 70) / 100,
-            valid_from=datetime.now(timezone.utc),
-            valid_until=datetime.now(timezone.utc) + timedelta(hours=48),
-            recommendations=prediction_data.get("recommendations", [])
+            prediction_text=forecast,
+            risk_level=risk_level,
+            confidence=confidence / 100,
+            valid_from=now,
+            valid_until=now + timedelta(hours=48),
+            recommendations=[r for r in recommendations if isinstance(r, str) and r],
+            created_at=now
         )
         
-        # Store prediction
-        doc = prediction.model_dump()
-        doc['valid_from'] = doc['valid_from'].isoformat()
-        doc['valid_until'] = doc['valid_until'].isoformat()
-        doc['created_at'] = doc['created_at'].isoformat()
-        await db.predictions.insert_one(doc)
+        # Store prediction (datetimes as native BSON dates)
+        await db.predictions.insert_one(prediction.model_dump())
         
+        ttl_put(_prediction_cache, cache_key, prediction, PREDICTION_TTL_SECONDS)
         return prediction
         
     except Exception as e:
         logger.error(f"AI prediction error: {e}")
         # Return fallback prediction
-        return Prediction(
+        now = datetime.now(timezone.utc)
+        return Prediction.model_construct(
+            id=uuid.uuid4().hex,
             disaster_type=disaster_type,
             region=region,
             prediction_text=f"Based on current data, {region} shows typical {disaster_type} risk patterns for this time of year. Continue to monitor official advisories.",
             risk_level="moderate",
             confidence=0.6,
-            valid_from=datetime.now(timezone.utc),
-            valid_until=datetime.now(timezone.utc) + timedelta(hours=48),
+            valid_from=now,
+            valid_until=now + timedelta(hours=48),
             recommendations=[
                 "Stay informed through official channels",
                 "Review emergency preparedness plans",
                 "Ensure emergency contacts are up to date"
-            ]
+            ],
+            created_at=now
         )
 
 @api_router.get("/predictions/history")
-async def get_prediction_history(disaster_type: Optional[str] = None, limit: int = 10):
+async def get_prediction_history(disaster_type: Optional[str] = None, limit: int = Query(10, ge=1)):
     """Get historical predictions"""
     query = {} if not disaster_type else {"disaster_type": disaster_type}
-    predictions = await db.predictions.find(query, {"_id": 0}).sort("created_at", -1).to_list(limit)
-    
-    for p in predictions:
-        for field in ['valid_from', 'valid_until', 'created_at']:
-            if isinstance(p.get(field), str):
-                p[field] = datetime.fromisoformat(p[field])
-    
-    return predictions
+    cursor = db.predictions.find(query, PREDICTION_HISTORY_FIELDS).sort("created_at", -1).limit(limit)
+    return await cursor.to_list(limit)
 
 # ==================== DASHBOARD SUMMARY ====================
 
+# Overall dashboard status by escalation level
+DASHBOARD_STATUS = ("normal", "moderate", "high", "critical")
+
 @api_router.get("/dashboard/summary")
 async def get_dashboard_summary():
     """Get comprehensive dashboard summary"""
-    seismic_stats = await get_seismic_stats()
-    flood_stats = await get_flood_stats()
-    heat_stats = await get_heatwave_stats()
-    hospital_stats = await get_hospital_stats()
+    # Independent sources - fetch them concurrently
+    seismic_stats, flood_stats, heat_stats, hospital_stats = await asyncio.gather(
+        get_seismic_stats(),
+        get_flood_stats(),
+        get_heatwave_stats(),
+        get_hospital_stats()
+    )
     
     # Calculate overall alert level
     critical_count = seismic_stats["critical_events"] + flood_stats["critical_zones"] + heat_stats["critical_areas"]
     high_count = seismic_stats["high_risk_events"] + flood_stats["high_risk_zones"] + heat_stats["high_risk_areas"]
     
-    if critical_count > 0:
-        overall_status = "critical"
-    elif high_count > 2:
-        overall_status = "high"
-    elif high_count > 0:
-        overall_status = "moderate"
-    else:
-        overall_status = "normal"
+    level = 3 if critical_count else (2 if high_count > 2 else (1 if high_count else 0))
+    overall_status = DASHBOARD_STATUS[level]
     
     return {
         "overall_status": overall_status,
@@ -810,7 +994,3 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
-
-@app.on_event("shutdown")
-async def shutdown_db_client():
-    client.close()
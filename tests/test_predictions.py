@@ -0,0 +1,73 @@
+"""
+Unit tests for /predictions/generate response shaping (LLM and database stubbed out)
+"""
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DB_NAME", "disasterwatch_test")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+import server  # noqa: E402
+
+
+class StubChat:
+    """Stands in for LlmChat, replying with a fixed message"""
+    reply = ""
+
+    def __init__(self, **kwargs):
+        pass
+
+    def with_model(self, *args):
+        return self
+
+    async def send_message(self, message):
+        return self.reply
+
+
+def generate(monkeypatch, reply: str):
+    stored = []
+
+    async def insert_one(doc):
+        stored.append(doc)
+
+    monkeypatch.setattr(StubChat, "reply", reply)
+    monkeypatch.setattr(server, "LlmChat", StubChat)
+    monkeypatch.setattr(server, "db", SimpleNamespace(predictions=SimpleNamespace(insert_one=insert_one)))
+    monkeypatch.setattr(server, "_prediction_cache", {})
+    monkeypatch.setattr(server, "_context_cache", {})
+
+    prediction = asyncio.run(server.generate_prediction(disaster_type="seismic", region="Lazio"))
+    return prediction, stored
+
+
+def test_null_valued_reply_falls_back_to_defaults(monkeypatch):
+    reply = '{"risk_level": null, "forecast": null, "recommendations": [null]}'
+    prediction, stored = generate(monkeypatch, reply)
+
+    assert prediction.prediction_text == reply
+    assert prediction.risk_level == "moderate"
+    assert prediction.recommendations == []
+    assert prediction.confidence == 0.7
+    assert stored == [prediction.model_dump()]
+
+
+def test_unknown_risk_level_and_non_string_recommendations_are_dropped(monkeypatch):
+    reply = '{"risk_level": "extreme", "forecast": "Aftershocks likely", "confidence": 80, "recommendations": ["Stay alert", 3, ""]}'
+    prediction, _ = generate(monkeypatch, reply)
+
+    assert prediction.prediction_text == "Aftershocks likely"
+    assert prediction.risk_level == "moderate"
+    assert prediction.recommendations == ["Stay alert"]
+    assert prediction.confidence == 0.8
+
+
+def test_risk_level_is_normalized_before_matching(monkeypatch):
+    reply = '{"risk_level": " High", "forecast": "Heavy rain expected", "recommendations": ["Avoid riverbanks"]}'
+    prediction, _ = generate(monkeypatch, reply)
+
+    assert prediction.risk_level == "high"